@@ -1,6 +1,7 @@
 # Stress/strain/geometry functions
 
 
+import math
 import numpy as np
 from Tectonic_Utils.geodesy import fault_vector_functions
 
@@ -14,36 +15,47 @@ def get_poissons_ratio_and_alpha(mu, lame1):
     return [poissons_ratio, alpha]
 
 
-def get_strain_tensor(dUidUj):
+def get_strain_tensor(dUidUj, out=None):
     """
     Starts with displacement gradient tensor (3x3 2D array)
     Returns a strain tensor (3x3 2D array).
+    A 3x3 buffer can be passed as `out` to be filled and reused between calls.
     """
-    rows, cols = np.shape(dUidUj)
-    strain_tensor = np.zeros(np.shape(dUidUj))
-    for i in range(rows):
-        for j in range(cols):
-            strain_tensor[i][j] = 0.5 * (dUidUj[i][j] + dUidUj[j][i])
+    dUidUj = np.asarray(dUidUj)
+    strain_tensor = np.empty((3, 3)) if out is None else out
+    np.add(dUidUj, dUidUj.T, out=strain_tensor)
+    strain_tensor *= 0.5
     return strain_tensor
 
 
-def get_stress_tensor(eij, lamda, mu):
+def get_stress_tensor(eij, lamda, mu, out=None):
     """
     Starts with strain tensor (3x3 2D array)
     Returns a stress tensor (3x3 2D array).
     lamda and mu are Lame parameters
+    A 3x3 buffer can be passed as `out` to be filled and reused between calls.
     """
-    rows, cols = np.shape(eij)
-    stress_tensor = np.zeros(np.shape(eij))
-    for i in range(rows):
-        for j in range(cols):
-            if i == j:
-                stress_tensor[i][j] = lamda*(eij[0][0]+eij[1][1]+eij[2][2]) + 2*mu*eij[i][j]
-            else:
-                stress_tensor[i][j] = 2*mu*eij[i][j]
+    eij = np.asarray(eij)
+    stress_tensor = np.empty((3, 3)) if out is None else out
+    trace_term = lamda * (eij[0, 0] + eij[1, 1] + eij[2, 2])
+    np.multiply(eij, 2.0 * mu, out=stress_tensor)
+    stress_tensor[0, 0] += trace_term
+    stress_tensor[1, 1] += trace_term
+    stress_tensor[2, 2] += trace_term
     return stress_tensor
 
 
+def get_stress_tensor_batch(eij, lamda, mu):
+    """
+    Starts with a stack of strain tensors (Nx3x3 array)
+    Returns a stack of stress tensors (Nx3x3 array).
+    lamda and mu are Lame parameters
+    """
+    eij = np.asarray(eij)
+    stress_tensors = lamda * np.einsum('...ii->...', eij)[..., None, None] * np.eye(3) + 2.0 * mu * eij
+    return stress_tensors
+
+
 def get_coulomb_stresses(tau, strike, rake, dip, friction, B):
     """
     Given a stress tensor, receiver strike, receiver rake, and receiver dip
@@ -82,24 +94,116 @@ def get_coulomb_stresses_internal(tau, rec_strike_vector, rake, rec_dip_vector,
     :param B: float, Skepmton's coefficient
     :returns: list of 3 floats, Return in KPa
     """
-    traction_vector = np.dot(tau, rec_plane_normal)
+    return coulomb_stresses_kernel(np.asarray(tau, dtype=float).tolist(), np.asarray(rec_strike_vector).tolist(),
+                                   float(rake), np.asarray(rec_dip_vector).tolist(),
+                                   np.asarray(rec_plane_normal).tolist(), friction, B)
+
+
+def coulomb_stresses_kernel(tau, strike_v, rake, dip_v, normal, friction, B):
+    """
+    Scalar kernel for get_coulomb_stresses_internal, written out on plain Python floats.
+    For one receiver, NumPy's per-call overhead on 3-element vectors costs far more than the arithmetic.
+
+    :param tau: 3x3 nested list of floats, stress tensor
+    :param strike_v: list of 3 floats
+    :param rake: float, in degrees
+    :param dip_v: list of 3 floats
+    :param normal: list of 3 floats
+    :param friction: float, coefficient of friction
+    :param B: float, Skepmton's coefficient
+    :returns: list of 3 floats, Return in KPa
+    """
+    (t00, t01, t02), (t10, t11, t12), (t20, t21, t22) = tau
+    n0, n1, n2 = normal
+    traction0 = t00*n0 + t01*n1 + t02*n2
+    traction1 = t10*n0 + t11*n1 + t12*n2
+    traction2 = t20*n0 + t21*n1 + t22*n2
 
     # The stress that's normal to the receiver fault plane:
-    dry_normal_stress = np.dot(rec_plane_normal, traction_vector)  # positive = unclamping (same as Coulomb software)
-    effective_normal_stress = dry_normal_stress - (np.trace(tau) / 3.0) * B
+    dry_normal_stress = n0*traction0 + n1*traction1 + n2*traction2  # positive = unclamping (same as Coulomb)
+    effective_normal_stress = dry_normal_stress - ((t00 + t11 + t22) / 3.0) * B
+
+    # The shear stresses causing strike slip and reverse slip (in the receiver fault plane).
+    shear_rtlat = strike_v[0]*traction0 + strike_v[1]*traction1 + strike_v[2]*traction2
+    shear_reverse = dip_v[0]*traction0 + dip_v[1]*traction1 + dip_v[2]*traction2
+
+    # The shear that we want (in the rake direction).
+    rake_rad = math.radians(rake)
+    shear_in_rake_dir = math.cos(rake_rad)*shear_rtlat - math.sin(rake_rad)*shear_reverse
+
+    # Finally, do unit conversion
+    effective_normal_stress = effective_normal_stress/1000.0  # convert to KPa
+    shear_stress = shear_in_rake_dir/1000.0
+
+    # The Coulomb Failure Hypothesis
+    coulomb_stress = shear_stress + (friction*effective_normal_stress)   # the sign here is important.
+
+    return effective_normal_stress, shear_stress, coulomb_stress
 
-    # The shear stress causing strike slip (in the receiver fault plane).
-    shear_rtlat = np.dot(rec_strike_vector, traction_vector)
 
-    # The shear stress causing reverse slip (in the receiver fault plane).
-    shear_reverse = np.dot(rec_dip_vector, traction_vector)
+def get_coulomb_stresses_batch(tau, strike_vecs, rakes, dip_vecs, normals, friction, B):
+    """
+    The math behind Coulomb stresses, resolved on many receivers at once.
+    Receiver geometry can be one plane (shape (3,)) or one plane per receiver (shape (N, 3)).
+
+    :param tau: full 3x3 stress tensor, or stack of N stress tensors with shape (N, 3, 3)
+    :param strike_vecs: array of strike unit vectors, shape (N, 3) or (3,)
+    :param rakes: float or 1d array of N rakes, in degrees
+    :param dip_vecs: array of dip unit vectors, shape (N, 3) or (3,)
+    :param normals: array of plane normal unit vectors, shape (N, 3) or (3,)
+    :param friction: float, coefficient of friction
+    :param B: float, Skepmton's coefficient
+    :returns: three 1d arrays of N floats, in KPa
+    """
+    tau, normals = np.asarray(tau), np.asarray(normals)
+    traction_vectors = _matrix_vector_batch(tau, normals)
+    mean_stress = np.einsum('...ii->...', tau) / 3.0
+    return _resolve_traction_batch(traction_vectors, mean_stress, strike_vecs, rakes, dip_vecs, normals, friction, B)
+
+
+def get_coulomb_stresses_from_strain_batch(eij, lamda, mu, strike_vecs, rakes, dip_vecs, normals, friction, B):
+    """
+    Strain tensors straight to Coulomb stresses on many receivers, without forming the stress tensors.
+    The traction on each plane is 2*mu*(eij . n) + lamda*tr(eij)*n, and the mean stress is (lamda + 2*mu/3)*tr(eij).
+
+    :param eij: strain tensor (3x3) or stack of N strain tensors with shape (N, 3, 3)
+    :param lamda: float, Lame's first parameter
+    :param mu: float, shear modulus
+    :param strike_vecs: array of strike unit vectors, shape (N, 3) or (3,)
+    :param rakes: float or 1d array of N rakes, in degrees
+    :param dip_vecs: array of dip unit vectors, shape (N, 3) or (3,)
+    :param normals: array of plane normal unit vectors, shape (N, 3) or (3,)
+    :param friction: float, coefficient of friction
+    :param B: float, Skepmton's coefficient
+    :returns: three 1d arrays of N floats, in KPa
+    """
+    eij, normals = np.asarray(eij), np.asarray(normals)
+    trace = np.einsum('...ii->...', eij)
+    traction_vectors = 2.0 * mu * _matrix_vector_batch(eij, normals) + lamda * trace[..., None] * normals
+    mean_stress = (lamda + 2.0 * mu / 3.0) * trace
+    return _resolve_traction_batch(traction_vectors, mean_stress, strike_vecs, rakes, dip_vecs, normals, friction, B)
+
+
+def _matrix_vector_batch(tensors, vectors):
+    """Products of (N, 3, 3) tensors with (N, 3) vectors, either of which may be a single shared operand."""
+    if tensors.ndim == 2 or vectors.ndim == 1:  # one operand shared by all receivers: a matrix product
+        return np.matmul(tensors, vectors[..., np.newaxis])[..., 0]
+    return np.einsum('...ij,...j->...i', tensors, vectors)
+
+
+def _resolve_traction_batch(traction_vectors, mean_stress, strike_vecs, rakes, dip_vecs, normals, friction, B):
+    """Resolve traction vectors on receiver planes into effective normal, shear, and Coulomb stresses (KPa)."""
+    # The stress that's normal to the receiver fault plane:
+    dry_normal_stress = np.einsum('...i,...i->...', normals, traction_vectors)  # positive = unclamping
+    effective_normal_stress = dry_normal_stress - mean_stress * B
+
+    # The shear stresses causing strike slip and reverse slip (in the receiver fault plane).
+    shear_rtlat = np.einsum('...i,...i->...', strike_vecs, traction_vectors)
+    shear_reverse = np.einsum('...i,...i->...', dip_vecs, traction_vectors)
 
     # The shear that we want (in the rake direction).
-    rake_rad = np.deg2rad(rake)
-    R = np.array([[np.cos(rake_rad), -np.sin(rake_rad)], [np.sin(rake_rad), np.cos(rake_rad)]])
-    shear_vector = [shear_rtlat, shear_reverse]
-    rotated_shear = np.dot(R, shear_vector)
-    shear_in_rake_dir = rotated_shear[0]
+    rake_rad = np.deg2rad(rakes)
+    shear_in_rake_dir = np.cos(rake_rad) * shear_rtlat - np.sin(rake_rad) * shear_reverse
 
     # Finally, do unit conversion
     effective_normal_stress = effective_normal_stress/1000.0  # convert to KPa
@@ -120,31 +224,46 @@ def get_R_from_strike(strike):
     # Preparing to rotate to a fault-oriented coordinate system.
     theta = strike - 90
     theta = np.deg2rad(theta)
-    R = np.array([[np.cos(theta), -np.sin(theta), 0], [np.sin(theta), np.cos(theta), 0],
-                  [0, 0, 1]])  # horizontal rotation into strike-aligned coordinates.
-    R2 = np.array([[np.cos(-theta), -np.sin(-theta), 0], [np.sin(-theta), np.cos(-theta), 0], [0, 0, 1]])
+    c, s = np.cos(theta), np.sin(theta)
+    R = np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])  # horizontal rotation into strike-aligned coordinates.
+    R2 = R.T  # the inverse rotation, by -theta
     return R, R2
 
 
 def rotate_points(x, y, degrees):
     """Rotate cartesian points into a new orthogonal coordinate system. Implements a rotation matrix. """
-    rot_matrix = np.array([[np.cos(np.deg2rad(degrees)), -np.sin(np.deg2rad(degrees))],
-                           [np.sin(np.deg2rad(degrees)), np.cos(np.deg2rad(degrees))]])
-    unprimed_vector = np.array([[x], [y]])
-    xprime, yprime = np.dot(rot_matrix, unprimed_vector)
+    c, s = np.cos(np.deg2rad(degrees)), np.sin(np.deg2rad(degrees))
+    xprime = c*x - s*y
+    yprime = s*x + c*y
     return xprime, yprime
 
 
 def rotate_list_of_points(xlist, ylist, degrees):
-    """Calls rotation matrix on a 1d list of points"""
-    xprime_list, yprime_list = [], []
-    for x, y in zip(xlist, ylist):
-        xprime, yprime = rotate_points(x, y, degrees)
-        xprime_list.append(xprime)
-        yprime_list.append(yprime)
+    """Applies one rotation matrix to a 1d list of points. Returns two 1d arrays. """
+    c, s = np.cos(np.deg2rad(degrees)), np.sin(np.deg2rad(degrees))
+    rot_matrix = np.array([[c, -s], [s, c]])
+    unprimed_points = np.vstack([np.asarray(xlist, dtype=float), np.asarray(ylist, dtype=float)])  # shape (2, N)
+    xprime_list, yprime_list = rot_matrix @ unprimed_points
     return xprime_list, yprime_list
 
 
+def latlon2xy_array(lons, lats, lon0, lat0):
+    """
+    Convert many lon/lat points into cartesian x/y (km) relative to a reference point, all at once.
+    Same haversine distance and initial bearing as fault_vector_functions.latlon2xy, for arrays.
+    """
+    lat0_rad, lats_rad = np.radians(lat0), np.radians(np.asarray(lats, dtype=float))
+    dlat = lats_rad - lat0_rad
+    dlon = np.radians(np.asarray(lons, dtype=float) - lon0)
+    a = np.sin(dlat/2) * np.sin(dlat/2) + np.cos(lat0_rad) * np.cos(lats_rad) * np.sin(dlon/2) * np.sin(dlon/2)
+    radius = 6371 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+    bearing = np.degrees(np.arctan2(np.sin(dlon) * np.cos(lats_rad),
+                                    np.cos(lat0_rad) * np.sin(lats_rad) -
+                                    np.sin(lat0_rad) * np.cos(lats_rad) * np.cos(dlon)))
+    azimuth = np.deg2rad(90 - (bearing + 360) % 360)
+    return radius * np.cos(azimuth), radius * np.sin(azimuth)
+
+
 def get_geom_attributes_from_receiver_profile(profile):
     """
     Pre-compute geometry for receiver plane
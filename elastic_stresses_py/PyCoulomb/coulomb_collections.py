@@ -13,6 +13,7 @@ Displacement_points = disp_points_object.Displacement_points
 
 # PyCoulomb faults object
 Faults_object = pyc_fault_object.Faults_object
+FaultArray = pyc_fault_object.FaultArray
 
 
 # Output from the Coulomb stress calculation
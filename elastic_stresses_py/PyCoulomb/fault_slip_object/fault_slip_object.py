@@ -3,7 +3,7 @@ The functions in this package operate on an internal class for faults/slip distr
 For all other formats, make sure you build read/write conversion AND TEST functions into internal format.
 """
 
-from ..pyc_fault_object import Faults_object
+from ..pyc_fault_object import Faults_object, FaultArray
 from Tectonic_Utils.geodesy import fault_vector_functions, haversine, insar_vector_functions
 from Tectonic_Utils.seismo import moment_calculations
 import numpy as np
@@ -297,14 +297,20 @@ def get_four_corners_lon_lat_multiple(fault_object_list):
     """
     Return global bounding-box lon/lat for a list of fault_objects as (W, E, S, N)
     """
-    lons_all, lats_all = [], []
-    for item in fault_object_list:
-        lons, lats = item.get_four_corners_lon_lat()
-        lons_all = lons_all + lons
-        lats_all = lats_all + lats
+    lons_all, lats_all = get_four_corners_lon_lat_array(fault_object_list)
     return np.min(lons_all), np.max(lons_all), np.min(lats_all), np.max(lats_all)
 
 
+def get_four_corners_lon_lat_array(fault_object_list):
+    """
+    Return the lon/lat of all 4 corners of each fault_object in a list, computed all at once.
+
+    :returns: two arrays of shape (N, 5), lons and lats, with the first corner repeated at the end
+    """
+    [lons, lats, _, _] = fault_object_list_to_fault_array(fault_object_list).get_fault_four_corners_geographic()
+    return lons, lats
+
+
 def get_total_moment(fault_object_list, mu=30e9) -> float:
     """
     Return the total moment of a list of slip objects, in fault_object
@@ -317,15 +323,32 @@ def get_total_moment(fault_object_list, mu=30e9) -> float:
 
 
 def get_total_moment_depth_dependent(fault_object_list, depths, mus) -> float:
-    """Compute total moment using a depth-dependent G calculation"""
-    total_moment = 0
-    for item in fault_object_list:
-        depth = item.get_fault_depth()
-        idx = np.abs(depths - depth).argmin()
-        G = mus[idx]
-        A = item.get_fault_area()
-        d = item.get_total_slip()
-        total_moment += moment_calculations.moment_from_muad(G, A, d)
+    """
+    Compute total moment using a depth-dependent G calculation.
+    Each patch takes the shear modulus of the nearest depth in the profile (the earlier entry in the profile, on ties).
+
+    :param fault_object_list: list of fault_slip_objects
+    :param depths: 1d array of depths in the shear modulus profile, km
+    :param mus: 1d array of shear moduli at those depths, Pa
+    :returns: float, Newton-meters
+    """
+    if not fault_object_list:
+        return 0
+    depths, mus = np.asarray(depths, dtype=float), np.asarray(mus, dtype=float)
+    order = np.argsort(depths, kind='stable')
+    sorted_depths = depths[order]
+    patch_depths = np.array([x.get_fault_depth() for x in fault_object_list], dtype=float)
+    A = np.array([x.get_fault_area() for x in fault_object_list], dtype=float)
+    d = np.array([x.get_total_slip() for x in fault_object_list], dtype=float)
+
+    # Nearest depth in the profile: compare each patch to the profile depths just above and below it.
+    below = np.clip(np.searchsorted(sorted_depths, patch_depths), 1, len(sorted_depths)-1)
+    above = np.searchsorted(sorted_depths, sorted_depths[below-1])  # first of any repeated profile depths
+    dist_above, dist_below = np.abs(patch_depths - sorted_depths[above]), np.abs(sorted_depths[below] - patch_depths)
+    use_above = (dist_above < dist_below) | ((dist_above == dist_below) & (order[above] < order[below]))
+    idx = order[np.where(use_above, above, below)] if len(sorted_depths) > 1 else np.zeros(len(patch_depths), int)
+    G = mus[idx]
+    total_moment = np.sum(moment_calculations.moment_from_muad(G, A, d))
     return total_moment
 
 
@@ -411,6 +434,31 @@ def coulomb_fault_to_fault_object(source_object):
     return fault_object_list
 
 
+def fault_object_list_to_fault_array(fault_object_list):
+    """
+    Convert a list of internal fault objects into a single FaultArray for Elastic_stresses_py.
+    Each patch keeps its own coordinate system, centered on its own lon/lat, as in the default
+    FaultSlipObject.fault_object_to_coulomb_fault().
+    """
+    lon = np.array([x.lon for x in fault_object_list], dtype=float)
+    lat = np.array([x.lat for x in fault_object_list], dtype=float)
+    strike = np.array([x.strike for x in fault_object_list], dtype=float)
+    dip = np.array([x.dip for x in fault_object_list], dtype=float)
+    depth = np.array([x.depth for x in fault_object_list], dtype=float)
+    rake = np.array([x.rake for x in fault_object_list], dtype=float)
+    length = np.array([x.length for x in fault_object_list], dtype=float)
+    width = np.array([x.width for x in fault_object_list], dtype=float)
+    slip = np.array([x.slip for x in fault_object_list], dtype=float)
+    _, bottom = fault_vector_functions.get_top_bottom_from_top(depth, width, dip)
+    rtlat, reverse = fault_vector_functions.get_rtlat_dip_slip(slip, rake)
+    startx, starty = np.zeros(len(fault_object_list)), np.zeros(len(fault_object_list))
+    xfinish, yfinish = fault_vector_functions.add_vector_to_point(startx, starty, length, strike)
+    return FaultArray(xstart=startx, xfinish=xfinish, ystart=starty, yfinish=yfinish, zerolon=lon, zerolat=lat,
+                      strike=strike, dipangle=dip, rake=rake, top=depth, bottom=bottom, rtlat=rtlat,
+                      reverse=reverse, tensile=[x.tensile for x in fault_object_list],
+                      segment=[x.segment for x in fault_object_list])
+
+
 def fault_object_to_coulomb_fault(fault_object_list, zerolon_system=None, zerolat_system=None):
     """
     Convert a list of internal fault objects into a list of source objects for Elastic_stresses_py.
@@ -1,7 +1,7 @@
 
 import collections.abc
-from ... import conversion_math
-from ..fault_slip_object import fault_object_to_coulomb_fault
+from ...pyc_fault_object import faults_list_to_arrays
+from ..fault_slip_object import fault_object_to_coulomb_fault, get_four_corners_lon_lat_array
 import numpy as np
 
 
@@ -25,19 +25,18 @@ def write_gmt_fault_file(fault_object_list, outfile, color_mappable=get_blank_fa
     """
     if verbose:
         print("Writing file %s " % outfile)
-    ofile = open(outfile, 'w')
-    for i, fault in enumerate(fault_object_list):
-        lons, lats = fault.get_four_corners_lon_lat()
-        if isinstance(color_mappable, collections.abc.Sequence):
+    all_lons, all_lats = get_four_corners_lon_lat_array(fault_object_list)
+    segments = []  # build the whole file in memory and write it once
+    for i, (fault, lons, lats) in enumerate(zip(fault_object_list, all_lons.tolist(), all_lats.tolist())):
+        if isinstance(color_mappable, (collections.abc.Sequence, np.ndarray)):
             color_string = "-Z"+str(color_mappable[i])  # if separately providing the color array
         else:
             color_string = "-Z"+str(color_mappable(fault))  # call the function that you've provided
-        ofile.write("> "+color_string+"\n")
-        ofile.write("%f %f\n" % (lons[0], lats[0]))
-        ofile.write("%f %f\n" % (lons[1], lats[1]))
-        ofile.write("%f %f\n" % (lons[2], lats[2]))
-        ofile.write("%f %f\n" % (lons[3], lats[3]))
-        ofile.write("%f %f\n" % (lons[0], lats[0]))
+        segments.append("> %s\n%f %f\n%f %f\n%f %f\n%f %f\n%f %f\n" % (color_string, lons[0], lats[0], lons[1],
+                                                                       lats[1], lons[2], lats[2], lons[3], lats[3],
+                                                                       lons[4], lats[4]))
+    ofile = open(outfile, 'w')
+    ofile.write("".join(segments))
     ofile.close()
     return
 
@@ -52,12 +51,11 @@ def write_gmt_surface_trace(fault_object_list, outfile, verbose=True):
     """
     if verbose:
         print("Writing file %s " % outfile)
+    all_lons, all_lats = get_four_corners_lon_lat_array(fault_object_list)
+    segments = ["> -Z\n%f %f\n%f %f\n" % (lons[0], lats[0], lons[1], lats[1])
+                for lons, lats in zip(all_lons.tolist(), all_lats.tolist())]
     ofile = open(outfile, 'w')
-    for fault in fault_object_list:
-        lons, lats = fault.get_four_corners_lon_lat()
-        ofile.write("> -Z\n")
-        ofile.write("%f %f\n" % (lons[0], lats[0]))
-        ofile.write("%f %f\n" % (lons[1], lats[1]))
+    ofile.write("".join(segments))
     ofile.close()
     return
 
@@ -74,34 +72,39 @@ def write_gmt_vertical_fault_file(fault_object_list, outfile, color_mappable=get
     # Get origin: extremal patch at the top. First, find bounding box for top points
     depth_array = [x.depth for x in fault_object_list]
     top_row_patches = [x for x in fault_object_list if x.depth == np.nanmin(depth_array)]
-    top_row_lon, top_row_lat = [], []
-    for patch in top_row_patches:
-        lon_updip, lat_updip = patch.get_updip_corners_lon_lat()
-        top_row_lon = top_row_lon + lon_updip
-        top_row_lat = top_row_lat + lat_updip  # joining two lists
-    bbox = [np.nanmin(top_row_lon), np.nanmax(top_row_lon), np.nanmin(top_row_lat), np.nanmax(top_row_lat)]
+    top_row_lons, top_row_lats = get_four_corners_lon_lat_array(top_row_patches)
+    top_row_lon = top_row_lons[:, 0:2].ravel()  # updip corners of each patch, in order
+    top_row_lat = top_row_lats[:, 0:2].ravel()
 
     # Find fault corner coordinates that are candidates for extremal points on fault. Choose one for origin.
+    # A corner qualifies if its lon is the min or max lon AND its lat is the min or max lat of the top row.
+    is_extremal_lon = (top_row_lon == np.nanmin(top_row_lon)) | (top_row_lon == np.nanmax(top_row_lon))
+    is_extremal_lat = (top_row_lat == np.nanmin(top_row_lat)) | (top_row_lat == np.nanmax(top_row_lat))
+    candidates = np.flatnonzero(is_extremal_lon & is_extremal_lat)  # should be one at each end of the fault
     origin_ll = [np.nan, np.nan]
-    for lon, lat in zip(top_row_lon, top_row_lat):
-        if lon in bbox and lat in bbox:
-            origin_ll = [lon, lat]  # this should be guaranteed to happen twice, once for each end.
-            break
-
-    ofile = open(outfile, 'w')
-    for fault in fault_object_list:
-        [source] = fault_object_to_coulomb_fault([fault], zerolon_system=origin_ll[0], zerolat_system=origin_ll[1])
-        [_, _, x_updip, y_updip] = source.get_fault_four_corners()
-        deeper_offset = fault.width*np.sin(np.deg2rad(fault.dip))
-        [xprime, _] = conversion_math.rotate_list_of_points(x_updip, y_updip, 90+fault.strike)
-        start_x, finish_x = xprime[0], xprime[1]
+    if len(candidates) > 0:
+        origin_ll = [float(top_row_lon[candidates[0]]), float(top_row_lat[candidates[0]])]
+
+    # Convert all patches into the common coordinate system at once, then rotate each into its along-strike axis.
+    sources = fault_object_to_coulomb_fault(fault_object_list, zerolon_system=origin_ll[0],
+                                            zerolat_system=origin_ll[1])
+    source_array = faults_list_to_arrays(sources)
+    [_, _, x_updip, y_updip] = source_array.get_fault_four_corners()
+    widths = np.array([x.width for x in fault_object_list], dtype=float)
+    deeper_offsets = (widths*np.sin(np.deg2rad(source_array.dipangle))).tolist()
+    rot_angles = np.deg2rad(90 + source_array.strike)[:, None]
+    xprimes = np.cos(rot_angles)*x_updip - np.sin(rot_angles)*y_updip + 0.0  # shape (N, 2). +0.0 clears -0.0
+    xprimes = xprimes.tolist()
+
+    segments = []
+    for fault, (start_x, finish_x), deeper_offset in zip(fault_object_list, xprimes, deeper_offsets):
         slip_amount = color_mappable(fault)
-        ofile.write("> -Z"+str(-slip_amount)+"\n")  # currently writing left-lateral slip as positive
-        ofile.write("%f %f\n" % (start_x, -fault.depth))
-        ofile.write("%f %f\n" % (finish_x, -fault.depth))
-        ofile.write("%f %f\n" % (finish_x, -fault.depth-deeper_offset))
-        ofile.write("%f %f\n" % (start_x, -fault.depth-deeper_offset))
-        ofile.write("%f %f\n" % (start_x, -fault.depth))
-
+        top, bottom = -fault.depth, -fault.depth-deeper_offset
+        # currently writing left-lateral slip as positive
+        segments.append("> -Z%s\n%f %f\n%f %f\n%f %f\n%f %f\n%f %f\n" % (str(-slip_amount), start_x, top, finish_x, top,
+                                                                         finish_x, bottom, start_x, bottom, start_x,
+                                                                         top))
+    ofile = open(outfile, 'w')
+    ofile.write("".join(segments))
     ofile.close()
     return
@@ -254,22 +254,34 @@ def convert_rectangle_into_two_triangles(one_fault_obj):
     return list_of_two_triangles
 
 
+def get_rectangle_triangle_vertices(x_all, y_all, top, bottom):
+    """
+    Split rectangles into two triangles each, given their corners from get_fault_four_corners().
+    Works on one rectangle, or on arrays of N rectangles with corners of shape (N, 5) and top/bottom of shape (N).
+
+    :returns: two arrays of vertices in meters with positive depths, each with shape (3, 3) or (N, 3, 3)
+    """
+    x_all, y_all = np.asarray(x_all), np.asarray(y_all)
+    top, bottom = np.asarray(top) * 1000, np.asarray(bottom) * 1000
+    v1, v2, v3, v4 = [np.stack([x_all[..., i] * 1000, y_all[..., i] * 1000, depth], axis=-1)
+                      for i, depth in enumerate([top, top, bottom, bottom])]
+    first = np.stack([v1, v3, v2], axis=-2)
+    second = np.stack([v1, v4, v3], axis=-2)
+    return first, second
+
+
 def convert_pycoulomb_rectangle_into_two_triangles(source, startlon, startlat):
     """
     Convert one rectangular pycoulomb_fault into two triangular faults. The fault normals are expected to point up.
     """
     [x_all, y_all, _, _] = source.get_fault_four_corners()  # This is cartesian
-    top_depth, bottom_depth = source.top, source.bottom
-    vertex1 = np.array([x_all[0]*1000, y_all[0]*1000, top_depth*1000])  # in meters
-    vertex2 = np.array([x_all[1]*1000, y_all[1]*1000, top_depth*1000])
-    vertex3 = np.array([x_all[2]*1000, y_all[2]*1000, bottom_depth*1000])
-    vertex4 = np.array([x_all[3]*1000, y_all[3]*1000, bottom_depth*1000])
+    first, second = get_rectangle_triangle_vertices(x_all, y_all, source.top, source.bottom)
     first_triangle = TriangleFault(lon=startlon, lat=startlat, segment=source.segment,
-                                   tensile=source.tensile, vertex1=vertex1, vertex2=vertex3, vertex3=vertex2,
-                                   dip_slip=source.reverse, rtlat_slip=source.rtlat, depth=float(vertex1[2])/1000)
+                                   tensile=source.tensile, vertex1=first[0], vertex2=first[1], vertex3=first[2],
+                                   dip_slip=source.reverse, rtlat_slip=source.rtlat, depth=float(first[0][2])/1000)
     second_triangle = TriangleFault(lon=startlon, lat=startlat, segment=source.segment,
-                                    tensile=source.tensile, vertex1=vertex1, vertex2=vertex4, vertex3=vertex3,
-                                    dip_slip=source.reverse, rtlat_slip=source.rtlat, depth=float(vertex1[2])/1000)
+                                    tensile=source.tensile, vertex1=second[0], vertex2=second[1], vertex3=second[2],
+                                    dip_slip=source.reverse, rtlat_slip=source.rtlat, depth=float(second[0][2])/1000)
     list_of_two_triangles = [first_triangle, second_triangle]
     return list_of_two_triangles
 
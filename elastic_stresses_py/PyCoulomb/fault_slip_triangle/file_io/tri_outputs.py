@@ -92,14 +92,13 @@ def write_gmt_vertical_fault_file(fault_object_list, outfile, color_mappable=ret
         x1, y1 = fault_vector_functions.latlon2xy_single(vertex1[0], vertex1[1], origin_lon, origin_lat)
         x2, y2 = fault_vector_functions.latlon2xy_single(vertex2[0], vertex2[1], origin_lon, origin_lat)
         x3, y3 = fault_vector_functions.latlon2xy_single(vertex3[0], vertex3[1], origin_lon, origin_lat)
-        [xprime1, _] = conversion_math.rotate_points(x1, y1, 90 + strike)
-        [xprime2, _] = conversion_math.rotate_points(x2, y2, 90 + strike)
-        [xprime3, _] = conversion_math.rotate_points(x3, y3, 90 + strike)
+        [[xprime1, xprime2, xprime3], _] = conversion_math.rotate_list_of_points([x1, x2, x3], [y1, y2, y3],
+                                                                                 90 + strike)
         ofile.write("> -Z"+str(slip)+"\n")  # whatever slip value the user chooses
-        ofile.write("%f %f\n" % (xprime1[0], -fault.vertex1[2]/1000))
-        ofile.write("%f %f\n" % (xprime2[0], -fault.vertex2[2]/1000))
-        ofile.write("%f %f\n" % (xprime3[0], -fault.vertex3[2]/1000))
-        ofile.write("%f %f\n" % (xprime1[0], -fault.vertex1[2]/1000))
+        ofile.write("%f %f\n" % (xprime1, -fault.vertex1[2]/1000))
+        ofile.write("%f %f\n" % (xprime2, -fault.vertex2[2]/1000))
+        ofile.write("%f %f\n" % (xprime3, -fault.vertex3[2]/1000))
+        ofile.write("%f %f\n" % (xprime1, -fault.vertex1[2]/1000))
     ofile.close()
     return
 
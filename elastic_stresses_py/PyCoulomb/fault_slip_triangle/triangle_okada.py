@@ -8,6 +8,8 @@ import cutde.halfspace as hs
 from . import fault_slip_triangle
 from .. import pyc_fault_object, utilities
 
+MAX_MATRIX_ENTRIES = 2**23  # Points are computed in blocks so each cutde matrix stays under ~64 MB of float64
+
 
 def convert_rect_sources_into_tris(rect_sources):
     """
@@ -28,19 +30,57 @@ def convert_rect_sources_into_tris(rect_sources):
     return tri_faults
 
 
+def get_source_tri_arrays(inputs):
+    """
+    Build the cutde source triangles and slip vectors for all rectangular and triangular sources.
+    Rectangles come first, split from the inputs' cached FaultArray, followed by any triangular sources.
+
+    :param inputs: an Input_object
+    :returns: src_tris with shape (Ntris, 3, 3) in meters with negative depths, slip_array with shape (Ntris, 3)
+    """
+    rects = inputs.get_source_array()
+    tri_sources = [x for x in inputs.source_object if isinstance(x, fault_slip_triangle.TriangleFault)]
+    reference = set(zip(rects.zerolon.tolist(), rects.zerolat.tolist())) | set((x.lon, x.lat) for x in tri_sources)
+    if len(reference) > 1:
+        raise ValueError("Error! Not all triangles have the same reference lon/lat")
+
+    rect_tris, rect_slip = get_rect_tri_arrays(rects)
+    tri_tris = np.array([[tri.vertex1, tri.vertex2, tri.vertex3] for tri in tri_sources], dtype=float).reshape(-1, 3, 3)
+    tri_tris[:, :, 2] *= -1
+    tri_slip = np.array([[-tri.rtlat_slip, tri.dip_slip, tri.tensile] for tri in tri_sources],
+                        dtype=float).reshape(-1, 3)
+    return np.concatenate([rect_tris, tri_tris]), np.concatenate([rect_slip, tri_slip])
+
+
+def get_rect_tri_arrays(fault_array):
+    """
+    Split every rectangle of a FaultArray into two cutde triangles at once.
+
+    :param fault_array: FaultArray of rectangular sources
+    :returns: src_tris with shape (2*Nrects, 3, 3) in meters with negative depths, slip_array with shape (2*Nrects, 3)
+    """
+    [x_all, y_all, _, _] = fault_array.get_fault_four_corners()
+    first, second = fault_slip_triangle.get_rectangle_triangle_vertices(x_all, y_all, fault_array.top,
+                                                                        fault_array.bottom)
+    rect_tris = np.stack([first, second], axis=1).reshape(-1, 3, 3)  # the two triangles of each rectangle together
+    rect_tris[:, :, 2] *= -1
+    rect_slip = np.repeat(np.stack([-fault_array.rtlat, fault_array.reverse, fault_array.tensile], axis=-1), 2, axis=0)
+    return rect_tris, rect_slip
+
+
 def compute_cartesian_strain_tris(inputs, params, strain_points):
     """
     Loop through a list of lon/lat and compute their strains due to all sources put together.
     Returns list of strain tensors
     """
-    tri_faults = convert_rect_sources_into_tris(inputs.source_object)
-    _, strain_tensors = compute_disp_points_from_triangles(tri_faults, strain_points, params.nu)
+    src_tris, slip_array = get_source_tri_arrays(inputs)
+    _, strain_tensors = compute_disp_points_from_tri_arrays(src_tris, slip_array, strain_points, params.nu)
     return strain_tensors
 
 
 def compute_cartesian_def_tris(inputs, params, obs_disp_points):
-    tri_faults = convert_rect_sources_into_tris(inputs.source_object)
-    modeled_tri_points, _ = compute_disp_points_from_triangles(tri_faults, obs_disp_points, params.nu)
+    src_tris, slip_array = get_source_tri_arrays(inputs)
+    modeled_tri_points, _ = compute_disp_points_from_tri_arrays(src_tris, slip_array, obs_disp_points, params.nu)
     return modeled_tri_points
 
 
@@ -62,23 +102,46 @@ def compute_disp_points_from_triangles(fault_triangles, disp_points, poisson_rat
     if not proceed_code:
         raise ValueError("Error! Triangular faults do not have same reference")
 
-    obsx = [point.lon*1000 for point in disp_points]
-    obsy = [point.lat*1000 for point in disp_points]   # calculation works in meters
-    obsz = [point.depth * -1000 for point in disp_points]  # in meters, negative is down
-    pts = np.vstack([obsx, obsy, obsz]).T   # shape: (Npts, 3)
-
     slip_array = np.array([[-src.rtlat_slip, src.dip_slip, src.tensile] for src in fault_triangles])  # shape:(Ntris, 3)
     fault_pts, fault_tris = fault_slip_triangle.extract_mesh_vertices(fault_triangles)
     fault_pts = fault_slip_triangle.flip_depth_sign(fault_pts)  # fault_pts shape: N_vertices, 3
     src_tris = fault_pts[fault_tris]  # src_tris shape: (Ntris, 3, 3)
-    disp_mat = hs.disp_matrix(obs_pts=pts, tris=src_tris, nu=poisson_ratio)  # disp_mat shape: (Npts, 3, Ntris, 3)
-    disp = disp_mat.reshape((-1, np.size(slip_array))).dot(slip_array.flatten())   # reshape by len of total slip vector
-    disp_grid = disp.reshape((*np.array(obsx).shape, 3))  # disp_grid shape: Npts, 3
-
-    # Get strain
-    strain_mat = hs.strain_matrix(obs_pts=pts, tris=src_tris, nu=poisson_ratio)  # strain_mat shape: (Npts, 6, Ntris, 3)
-    strain = strain_mat.reshape((-1, np.size(slip_array))).dot(slip_array.flatten())  # reshape by len total slip vector
-    strain_tensors = strain.reshape((*np.array(obsx).shape, 6))  # strain_tensors shape: Npts, 6
+    return compute_disp_points_from_tri_arrays(src_tris, slip_array, disp_points, poisson_ratio)
+
+
+def compute_disp_points_from_tri_arrays(src_tris, slip_array, disp_points, poisson_ratio):
+    """
+    Same as compute_disp_points_from_triangles, for triangles that are already in cutde's array format.
+
+    :param src_tris: array with shape (Ntris, 3, 3), vertices in meters with negative depths
+    :param slip_array: array with shape (Ntris, 3), left-lateral, reverse, and tensile slip
+    :param disp_points: list
+    :param poisson_ratio: float
+    :returns: list of disp_points objects, list of strain tensors in 3x3 matrix
+    """
+    if not disp_points:
+        return [], []
+    if len(src_tris) == 0:
+        return utilities.get_zeros_disp_points(disp_points), utilities.get_zeros_strain_points(disp_points)
+
+    obsx = [point.lon*1000 for point in disp_points]
+    obsy = [point.lat*1000 for point in disp_points]   # calculation works in meters
+    obsz = [point.depth * -1000 for point in disp_points]  # in meters, negative is down
+    pts = np.column_stack([obsx, obsy, obsz])   # shape: (Npts, 3), C-ordered as cutde expects
+
+    # Work through the points in blocks, so the (Npts, 6, Ntris, 3) matrices don't grow with the size of the grid
+    slip_vector = slip_array.flatten()
+    block_size = max(1, MAX_MATRIX_ENTRIES // (6 * np.size(slip_array)))
+    disp_grid = np.empty((len(pts), 3))  # disp_grid shape: Npts, 3
+    strain_tensors = np.empty((len(pts), 6))  # strain_tensors shape: Npts, 6
+    for i0 in range(0, len(pts), block_size):
+        block = pts[i0:i0 + block_size]
+        disp_mat = hs.disp_matrix(obs_pts=block, tris=src_tris, nu=poisson_ratio)  # shape: (Nblock, 3, Ntris, 3)
+        disp = disp_mat.reshape((-1, np.size(slip_array))).dot(slip_vector)  # reshape by len of total slip vector
+        disp_grid[i0:i0 + block_size] = disp.reshape(-1, 3)
+        strain_mat = hs.strain_matrix(obs_pts=block, tris=src_tris, nu=poisson_ratio)  # shape: (Nblock, 6, Ntris, 3)
+        strain = strain_mat.reshape((-1, np.size(slip_array))).dot(slip_vector)  # reshape by len total slip vector
+        strain_tensors[i0:i0 + block_size] = strain.reshape(-1, 6)
     # strain[:,0] is the xx component of strain, 1 is yy, 2 is zz, 3 is xy, 4 is xz, and 5 is yz.
 
     # Package the results into usable formats
@@ -1,5 +1,6 @@
 import numpy as np
 from Tectonic_Utils.geodesy import fault_vector_functions
+from .. import pyc_fault_object
 
 
 class Input_object:
@@ -29,6 +30,45 @@ class Input_object:
         if len(self.source_object) == 0:
             raise ValueError("Error! Valid Input_objects must have nonzero source_object.")
 
+    @property
+    def source_object(self):
+        return self._source_object
+
+    @source_object.setter
+    def source_object(self, value):
+        self._source_object = value
+        self._source_array = None  # rectangular source geometry as arrays, filled in on first use
+
+    @property
+    def receiver_object(self):
+        return self._receiver_object
+
+    @receiver_object.setter
+    def receiver_object(self, value):
+        self._receiver_object = value
+        self._receiver_array = None  # receiver geometry as arrays, filled in on first use
+
+    def get_receiver_array(self):
+        """
+        Return the receiver faults as a FaultArray, including their (N, 3) strike, dip, and normal unit vectors.
+        Receiver geometry doesn't change during a calculation, so this is computed once and reused.
+        Assigning a new receiver_object clears it; reassign the list after editing it in place.
+        """
+        if self._receiver_array is None:
+            self._receiver_array = pyc_fault_object.faults_list_to_arrays(self.receiver_object)
+        return self._receiver_array
+
+    def get_source_array(self):
+        """
+        Return the rectangular (finite) fault sources as a FaultArray, leaving out point sources and other source types.
+        Computed once and reused, like the receiver array.
+        """
+        if self._source_array is None:
+            rect_sources = [x for x in self.source_object if isinstance(x, pyc_fault_object.Faults_object)
+                            and not x.is_point_source]
+            self._source_array = pyc_fault_object.faults_list_to_arrays(rect_sources)
+        return self._source_array
+
     def define_map_region(self):
         """
         Define bounding box for map [W, E, S, N] based on sources and receivers, if bigger than coord system
@@ -163,10 +163,11 @@ def write_stress_results(obs_strain_points, strains, lame1, mu, outfile):
         print("Writing file %s " % outfile)
         ofile = open(outfile, 'w')
         ofile.write("# Format: lon lat depth_km sigma_xx sigma_xy sigma_xz sigma_yy sigma_yz sigma_zz (kPa)\n")
+        stress_tensor = np.empty((3, 3))
         for i in range(len(obs_strain_points)):
             eij = strains[i]
-            stress_tensor = conversion_math.get_stress_tensor(eij, lame1, mu)
-            stress_tensor = np.divide(stress_tensor, 1000)  # convert to kPa
+            conversion_math.get_stress_tensor(eij, lame1, mu, out=stress_tensor)
+            stress_tensor /= 1000  # convert to kPa
             ofile.write("%f %f %f " % (obs_strain_points[i].lon, obs_strain_points[i].lat, obs_strain_points[i].depth))
             ofile.write("%f %f %f " % (stress_tensor[0][0], stress_tensor[0][1], stress_tensor[0][2]))
             ofile.write("%f %f %f\n" % (stress_tensor[1][1], stress_tensor[1][2], stress_tensor[2][2]))
@@ -245,12 +245,10 @@ def stress_cross_section_cartesian(params, out_object, stress_type, vmin=None, v
         zcoords = [out_object.receiver_object[i].top, out_object.receiver_object[i].bottom,
                    out_object.receiver_object[i].bottom, out_object.receiver_object[i].top]
         fault_strike = out_object.receiver_object[i].strike
-        x1, y1 = conversion_math.rotate_points(xcoords[0], ycoords[0], fault_strike)
-        x2, y2 = conversion_math.rotate_points(xcoords[1], ycoords[1], fault_strike)
-        x3, y3 = conversion_math.rotate_points(xcoords[2], ycoords[2], fault_strike)
-        x4, y4 = conversion_math.rotate_points(xcoords[3], ycoords[3], fault_strike)
-        ycoords = [y1, y2, y3, y4]
-        total_y_array = total_y_array + ycoords
+        _, yprime = conversion_math.rotate_list_of_points(xcoords, ycoords, fault_strike)
+        ycoords = yprime.tolist()
+        y1, y2, y3, y4 = ycoords
+        total_y_array.extend(ycoords)
         fault_vertices = np.column_stack((ycoords, zcoords))
         patch_color = custom_cmap.to_rgba(stress_component[i])
 
@@ -301,9 +299,8 @@ def map_horiz_profile(horiz_profile, profile_results, outfile, vmin=-200, vmax=2
     plt.rcParams['savefig.dpi'] = 300
     fig = plt.figure(figsize=(14, 8), dpi=300)
     levels = np.linspace(vmin, vmax, 20)
-    if cap_colorbar:  # do we force the higher values to the top of the colorbar?
-        coulomb_stress[coulomb_stress > vmax] = vmax
-        coulomb_stress[coulomb_stress < vmin] = vmin
+    if cap_colorbar:  # do we force the higher values to the top of the colorbar? (on a copy, not the results)
+        coulomb_stress = np.clip(coulomb_stress, vmin, vmax)
     dislay_map = plt.contourf(x, y, coulomb_stress, levels=levels, cmap='RdYlBu_r', vmin=vmin, vmax=vmax)
     plt.title('Coulomb stresses on horizontal profile, fixed strike/dip/rake/depth of '+str(horiz_profile.strike)+', ' +
               str(horiz_profile.dip)+', '+str(horiz_profile.rake)+', '+str(horiz_profile.depth_km))
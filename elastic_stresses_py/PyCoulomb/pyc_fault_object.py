@@ -6,6 +6,12 @@ import numpy as np
 
 # PyCoulomb faults object.
 class Faults_object:
+    # Fixed attribute set: no per-instance __dict__, and faster attribute access on large lists of patches.
+    __slots__ = ('xstart', 'xfinish', 'ystart', 'yfinish', 'zerolon', 'zerolat', 'rtlat', 'reverse', 'tensile',
+                 'potency', 'strike', 'dipangle', 'rake', 'top', 'bottom', 'comment', 'Kode', 'segment',
+                 'is_point_source', 'R', 'R2', 'L', 'W', 'strike_unit_vector', 'dip_unit_vector', 'plane_normal',
+                 'area')
+
     def __init__(self, xstart, xfinish, ystart, yfinish, zerolon, zerolat, strike, dipangle, rake, top, bottom,
                  rtlat=0, reverse=0, tensile=0, potency=(), comment=None, Kode=100, segment=0):
         """
@@ -132,10 +138,104 @@ class Faults_object:
         return [x_total, y_total, x_updip, y_updip]
 
 
+# PyCoulomb faults, stored field-by-field across many patches.
+class FaultArray:
+    def __init__(self, xstart, xfinish, ystart, yfinish, zerolon, zerolat, strike, dipangle, rake, top, bottom,
+                 rtlat, reverse, tensile, segment):
+        """
+        Structure-of-arrays version of a list of Faults_objects. Each field is a 1d array with one entry per patch,
+        so that geometry over many patches can be computed in a few vectorized expressions.
+        """
+        self.xstart, self.xfinish = np.asarray(xstart, dtype=float), np.asarray(xfinish, dtype=float)  # km
+        self.ystart, self.yfinish = np.asarray(ystart, dtype=float), np.asarray(yfinish, dtype=float)  # km
+        self.zerolon, self.zerolat = np.asarray(zerolon, dtype=float), np.asarray(zerolat, dtype=float)  # degrees
+        self.strike = np.asarray(strike, dtype=float)  # degrees
+        self.dipangle = np.asarray(dipangle, dtype=float)  # degrees
+        self.rake = np.asarray(rake, dtype=float)  # degrees
+        self.top = np.asarray(top, dtype=float)  # km
+        self.bottom = np.asarray(bottom, dtype=float)  # km
+        self.rtlat = np.asarray(rtlat, dtype=float)  # meters
+        self.reverse = np.asarray(reverse, dtype=float)  # meters
+        self.tensile = np.asarray(tensile, dtype=float)  # meters
+        self.segment = np.asarray(segment, dtype=object)  # segment labels, kept as given (int, string, ...)
+        self.L = np.hypot(self.xfinish - self.xstart, self.yfinish - self.ystart)  # in km
+        self.W = fvf.get_downdip_width(self.top, self.bottom, self.dipangle)  # in km
+        strike_theta = np.deg2rad(90 - self.strike)
+        self.strike_unit_vector = np.column_stack([np.cos(strike_theta), np.sin(strike_theta),
+                                                   np.zeros(len(strike_theta))])  # (N, 3), in horiz. plane.
+        self.dip_unit_vector = np.column_stack(fvf.get_dip_vector(self.strike, self.dipangle))  # (N, 3)
+        self.plane_normal = np.column_stack(fvf.simple_cross_product(self.dip_unit_vector.T,
+                                                                     self.strike_unit_vector.T))  # (N, 3)
+
+    def __len__(self):
+        return len(self.xstart)
+
+    def __getitem__(self, key):
+        """
+        Select patches by index, slice, or boolean mask. Returns a new FaultArray.
+        """
+        key = np.atleast_1d(key) if np.isscalar(key) else key
+        return FaultArray(xstart=self.xstart[key], xfinish=self.xfinish[key], ystart=self.ystart[key],
+                          yfinish=self.yfinish[key], zerolon=self.zerolon[key], zerolat=self.zerolat[key],
+                          strike=self.strike[key], dipangle=self.dipangle[key], rake=self.rake[key],
+                          top=self.top[key], bottom=self.bottom[key], rtlat=self.rtlat[key],
+                          reverse=self.reverse[key], tensile=self.tensile[key], segment=self.segment[key])
+
+    def get_fault_center(self):
+        """
+        Compute the x-y-z coordinates of the centers of all fault patches
+
+        :returns: tuple of (x, y, z) arrays
+        """
+        center_z = (self.top+self.bottom)/2.0
+        updip_center_x = (self.xstart+self.xfinish)/2.0
+        updip_center_y = (self.ystart+self.yfinish)/2.0
+        vector_mag = self.W*np.cos(np.deg2rad(self.dipangle))/2.0  # how far middle is displaced, downdip, in map-view
+        center_x, center_y = fvf.add_vector_to_point(updip_center_x, updip_center_y, vector_mag, self.strike+90)
+        return center_x, center_y, center_z
+
+    def get_fault_four_corners(self):
+        """
+        Get four corners of all patches in km, including updip and downdip corners.
+
+        :returns: x_total and y_total with shape (N, 5), x_updip and y_updip with shape (N, 2)
+        """
+        vector_mag = self.W*np.cos(np.deg2rad(self.dipangle))  # amount bottom edge is displaced, in map view
+        downdip_x0, downdip_y0 = fvf.add_vector_to_point(self.xstart, self.ystart, vector_mag, self.strike+90)
+        downdip_x1, downdip_y1 = fvf.add_vector_to_point(self.xfinish, self.yfinish, vector_mag, self.strike+90)
+        x_total = np.stack([self.xstart, self.xfinish, downdip_x1, downdip_x0, self.xstart], axis=1)
+        y_total = np.stack([self.ystart, self.yfinish, downdip_y1, downdip_y0, self.ystart], axis=1)
+        return [x_total, y_total, x_total[:, 0:2], y_total[:, 0:2]]
+
+    def get_fault_four_corners_geographic(self):
+        """
+        Get geographic four corners of all patches in lon/lat, including updip and downdip corners.
+
+        :returns: lon_total and lat_total with shape (N, 5), lon_updip and lat_updip with shape (N, 2)
+        """
+        [x_total, y_total, _, _] = self.get_fault_four_corners()
+        lon_total, lat_total = fvf.xy2lonlat_single(x_total, y_total, self.zerolon[:, None], self.zerolat[:, None])
+        return [lon_total, lat_total, lon_total[:, 0:2], lat_total[:, 0:2]]
+
+
 # ----------------------------
 # FUNCTIONS ON LISTS OF OBJECTS
 # ----------------------------
 
+def faults_list_to_arrays(list_of_faults):
+    """
+    Convert a list of Faults_objects into a single FaultArray.
+    """
+    return FaultArray(xstart=[x.xstart for x in list_of_faults], xfinish=[x.xfinish for x in list_of_faults],
+                      ystart=[x.ystart for x in list_of_faults], yfinish=[x.yfinish for x in list_of_faults],
+                      zerolon=[x.zerolon for x in list_of_faults], zerolat=[x.zerolat for x in list_of_faults],
+                      strike=[x.strike for x in list_of_faults], dipangle=[x.dipangle for x in list_of_faults],
+                      rake=[x.rake for x in list_of_faults], top=[x.top for x in list_of_faults],
+                      bottom=[x.bottom for x in list_of_faults], rtlat=[x.rtlat for x in list_of_faults],
+                      reverse=[x.reverse for x in list_of_faults], tensile=[x.tensile for x in list_of_faults],
+                      segment=[x.segment for x in list_of_faults])
+
+
 def get_faults_slip_moment(list_of_faults, mu):
     total_moment = 0
     for patch in list_of_faults:
@@ -24,9 +24,9 @@ def do_stress_computation(params, inputs, disp_points=(), strain_points=()):
     subfaulted_inputs = split_subfault_receivers(params, inputs)
 
     # Computes here.
-    [x, y, x2d, y2d, u_disps, v_disps, w_disps] = compute_grid_def(subfaulted_inputs, params)
-    model_disp_points = compute_ll_def(subfaulted_inputs, params, disp_points)
-    strain_tensor_results = compute_ll_strain(inputs, params, strain_points)
+    [x, y, x2d, y2d, u_disps, v_disps, w_disps], model_disp_points = compute_grid_and_ll_def(subfaulted_inputs, params,
+                                                                                            disp_points)
+    strain_tensor_results = compute_ll_strain(subfaulted_inputs, params, strain_points)  # shares source geometry
     receiver_normal, receiver_shear, receiver_coulomb = compute_strains_stresses(params, subfaulted_inputs)
     receiver_profile_results = compute_stresses_horiz_profile(params, subfaulted_inputs)
 
@@ -56,35 +56,32 @@ def split_subfault_receivers(params, inputs):
             # We find the depths corresponding to the tops and bottoms of our new sub-faults
             zsplit_array = get_split_z_array(fault.top, fault.bottom, dip_split)
 
-            for j in range(dip_split):  # First we split it up by dip.
-                # Get the new coordinates of the top of the fault plane.
-                W = fault_vector_functions.get_downdip_width(fault.top, zsplit_array[j], fault.dipangle)
-                vector_mag = W * np.cos(
-                    np.deg2rad(fault.dipangle))  # how far the bottom edge is displaced downdip from map-view
-
-                # Get the starting points for the next row of fault subpatches.
-                [start_x_top, start_y_top] = fault_vector_functions.add_vector_to_point(fault.xstart, fault.ystart,
-                                                                                        vector_mag, fault.strike + 90)
-                [finish_x_top, finish_y_top] = fault_vector_functions.add_vector_to_point(fault.xfinish, fault.yfinish,
-                                                                                          vector_mag, fault.strike +
-                                                                                          90)
-
-                [xsplit_array, ysplit_array] = get_split_x_y_arrays(start_x_top, finish_x_top, start_y_top,
-                                                                    finish_y_top, strike_split)
-
-                for k in range(strike_split):
-                    single_subfaulted_receiver = pyc_fault_object.Faults_object(xstart=xsplit_array[k],
-                                                                                xfinish=xsplit_array[k + 1],
-                                                                                ystart=ysplit_array[k],
-                                                                                yfinish=ysplit_array[k + 1],
-                                                                                Kode=fault.Kode, strike=fault.strike,
-                                                                                dipangle=fault.dipangle,
-                                                                                zerolon=inputs.zerolon,
-                                                                                zerolat=inputs.zerolat,
-                                                                                rake=fault.rake, top=zsplit_array[j],
-                                                                                bottom=zsplit_array[j + 1],
-                                                                                comment=fault.comment)
-                    subfaulted_receivers.append(single_subfaulted_receiver)
+            # Get the new coordinates of the top of each row of sub-faults, all rows at once.
+            W = fault_vector_functions.get_downdip_width(fault.top, zsplit_array[:-1], fault.dipangle)
+            vector_mag = W * np.cos(np.deg2rad(fault.dipangle))  # how far each row's top edge is displaced downdip
+            [start_x_top, start_y_top] = fault_vector_functions.add_vector_to_point(fault.xstart, fault.ystart,
+                                                                                    vector_mag, fault.strike + 90)
+            [finish_x_top, finish_y_top] = fault_vector_functions.add_vector_to_point(fault.xfinish, fault.yfinish,
+                                                                                      vector_mag, fault.strike + 90)
+
+            # Along-strike split points for every row: shape (dip_split, strike_split+1)
+            [xsplit_array, ysplit_array] = get_split_x_y_arrays(start_x_top, finish_x_top, start_y_top, finish_y_top,
+                                                                strike_split)
+            xsplit_array, ysplit_array = xsplit_array.tolist(), ysplit_array.tolist()
+            zsplit_array = zsplit_array.tolist()
+
+            subfaulted_receivers += [pyc_fault_object.Faults_object(xstart=xsplit_array[j][k],
+                                                                    xfinish=xsplit_array[j][k + 1],
+                                                                    ystart=ysplit_array[j][k],
+                                                                    yfinish=ysplit_array[j][k + 1],
+                                                                    Kode=fault.Kode, strike=fault.strike,
+                                                                    dipangle=fault.dipangle,
+                                                                    zerolon=inputs.zerolon,
+                                                                    zerolat=inputs.zerolat,
+                                                                    rake=fault.rake, top=zsplit_array[j],
+                                                                    bottom=zsplit_array[j + 1],
+                                                                    comment=fault.comment)
+                                     for j in range(dip_split) for k in range(strike_split)]
 
     subfaulted_objects = cc.Input_object(PR1=inputs.PR1, FRIC=inputs.FRIC, depth=inputs.depth,
                                          start_gridx=inputs.start_gridx, finish_gridx=inputs.finish_gridx,
@@ -103,28 +100,16 @@ def get_split_x_y_arrays(start_x_top, finish_x_top, start_y_top, finish_y_top, s
     Take the coordinates of the top of a receiver fault plane.
     Generate the list of coordinates that will help split it up along-strike
     strike_slip : int
+    If given arrays for several rows of the fault plane, returns one row of split points per row.
     """
-    if start_x_top == finish_x_top:
-        xsplit_array = [start_x_top for _j in range(strike_split + 1)]
-    else:
-        xincrement = (finish_x_top - start_x_top) / strike_split
-        xsplit_array = np.arange(start_x_top, finish_x_top + xincrement, xincrement)
-    # length : xsplit+1. contains all the xlocations that could be used as start-stop points in the top row.
-    if start_y_top == finish_y_top:
-        ysplit_array = [start_y_top for _j in range(strike_split + 1)]
-    else:
-        yincrement = (finish_y_top - start_y_top) / strike_split
-        ysplit_array = np.arange(start_y_top, finish_y_top + yincrement, yincrement)
-    # length : xsplit+1. contains all the ylocations that could be used as start-stop points in the top row.
+    # length : strike_split+1. contains all the x and y locations that could be used as start-stop points in top row.
+    xsplit_array = np.linspace(start_x_top, finish_x_top, strike_split + 1, axis=-1)
+    ysplit_array = np.linspace(start_y_top, finish_y_top, strike_split + 1, axis=-1)
     return [xsplit_array, ysplit_array]
 
 
 def get_split_z_array(top, bottom, dip_split):
-    if top == bottom:
-        zsplit_array = [top for _j in range(dip_split + 1)]
-    else:
-        zincrement = abs(top - bottom) / dip_split
-        zsplit_array = np.arange(top, bottom + zincrement, zincrement)
+    zsplit_array = np.linspace(top, bottom, dip_split + 1)
     return zsplit_array
 
 
@@ -150,10 +135,11 @@ def compute_ll_def(inputs, params, disp_points):
 
 def compute_xy_strain(inputs, params, strain_points):
     """ Loop through inputs and compute strain from all sources at given points, in cartesian coords.
-    Strain_points is a list. # NEED TO ADD MOGI-SOURCE STRAINS  """
+    Strain_points is a list. Returns an array of strain tensors, shape (N, 3, 3).
+    # NEED TO ADD MOGI-SOURCE STRAINS  """
     strain_tensors1 = triangle_okada.compute_cartesian_strain_tris(inputs, params, strain_points)
     strain_tensors2 = point_sources.compute_cartesian_strain_point(inputs, params, strain_points)
-    strain_tensors_total = [np.add(x, y) for x, y in zip(strain_tensors1, strain_tensors2)]
+    strain_tensors_total = np.add(np.reshape(strain_tensors1, (-1, 3, 3)), np.reshape(strain_tensors2, (-1, 3, 3)))
     return strain_tensors_total
 
 
@@ -170,29 +156,41 @@ def compute_grid_def(inputs, params):
     """
     Loop through a grid and compute the displacements at each point from all sources put together.
     """
+    grid_results, _ = compute_grid_and_ll_def(inputs, params, [])
+    return grid_results
+
+
+def compute_grid_and_ll_def(inputs, params, disp_points):
+    """
+    Compute the displacements on the grid and at a list of lon/lat points together,
+    in a single pass over the sources.
+
+    :returns: [x, y, x2d, y2d, u_displacements, v_displacements, w_displacements], list of model disp_points
+    """
     x = np.linspace(inputs.start_gridx, inputs.finish_gridx,
-                    int((inputs.finish_gridx - inputs.start_gridx) / inputs.xinc))
+                    int(round((inputs.finish_gridx - inputs.start_gridx) / inputs.xinc)) + 1)
     y = np.linspace(inputs.start_gridy, inputs.finish_gridy,
-                    int((inputs.finish_gridy - inputs.start_gridy) / inputs.yinc))
-    [x2d, y2d] = np.meshgrid(x, y)
+                    int(round((inputs.finish_gridy - inputs.start_gridy) / inputs.yinc)) + 1)
+    # Read-only broadcast views of the grid coordinates, instead of two dense (ny, nx) copies from np.meshgrid
+    x2d, y2d = np.broadcast_arrays(x[np.newaxis, :], y[:, np.newaxis])
     u_disps, v_disps, w_disps = np.zeros(np.shape(x2d)), np.zeros(np.shape(x2d)), np.zeros(np.shape(x2d))
 
-    if not params.plot_grd_disp:
-        return [x, y, x2d, y2d, u_disps, v_disps, w_disps]
-
-    print("Computing synthetic grid of displacements")
-    numrows, numcols = np.shape(u_disps)
+    grid_points = []
+    if params.plot_grd_disp:
+        print("Computing synthetic grid of displacements")
+        grid_points = [Displacement_points(lon=xi, lat=yi) for xi, yi in zip(np.tile(x, len(y)).tolist(),
+                                                                              np.repeat(y, len(x)).tolist())]
+    cart_disp_points = utilities.convert_ll2xy_disp_points(disp_points, inputs.zerolon, inputs.zerolat)
 
-    disp_points = []
-    for ky in range(numrows):
-        for kx in range(numcols):
-            disp_points.append(Displacement_points(lon=x2d[ky][kx], lat=y2d[ky][kx]))
+    modeled_disps = compute_xy_def(inputs, params, grid_points + cart_disp_points)
+    modeled_grid, modeled_cart_points = modeled_disps[:len(grid_points)], modeled_disps[len(grid_points):]
 
-    modeled_disps = compute_xy_def(inputs, params, disp_points)
-    u_displacements = np.array([x.dE_obs for x in modeled_disps]).reshape(np.shape(u_disps))
-    v_displacements = np.array([x.dN_obs for x in modeled_disps]).reshape(np.shape(v_disps))
-    w_displacements = np.array([x.dU_obs for x in modeled_disps]).reshape(np.shape(w_disps))
-    return [x, y, x2d, y2d, u_displacements, v_displacements, w_displacements]
+    if params.plot_grd_disp:
+        u_disps = np.array([x.dE_obs for x in modeled_grid]).reshape(np.shape(u_disps))
+        v_disps = np.array([x.dN_obs for x in modeled_grid]).reshape(np.shape(v_disps))
+        w_disps = np.array([x.dU_obs for x in modeled_grid]).reshape(np.shape(w_disps))
+    model_disp_points = utilities.transform_disp_points_ll_by_key_array(modeled_cart_points, disp_points)  # back to ll
+    return [x, y, x2d, y2d, u_disps, v_disps, w_disps], model_disp_points
 
 
 def compute_stresses_horiz_profile(params, inputs):
@@ -202,7 +200,7 @@ def compute_stresses_horiz_profile(params, inputs):
 
     :param params: named tuple
     :param inputs: named tuple
-    :returns: list of 3 lists, representing receiver normal, shear, and coulomb stress results
+    :returns: list of 3 arrays, representing receiver normal, shear, and coulomb stress results
     """
     if not inputs.receiver_horiz_profile:
         return None
@@ -210,31 +208,21 @@ def compute_stresses_horiz_profile(params, inputs):
     # Build a regular grid and iterate through.
     print("Resolving stresses on a horizontal profile.")
     profile = inputs.receiver_horiz_profile
-    receiver_normal, receiver_shear, receiver_coulomb, strain_points = [], [], [], []
 
     # perf improvement: Compute receiver geometry just once, since it's a profile of fixed geometry
     rec_strike_v, rec_dip_v, rec_plane_normal = conversion_math.get_geom_attributes_from_receiver_profile(profile)
 
-    for i in range(len(inputs.receiver_horiz_profile.lon1d)):
-        [xi, yi] = fault_vector_functions.latlon2xy(profile.lon1d[i], profile.lat1d[i], inputs.zerolon, inputs.zerolat)
-        strain_points.append(Displacement_points(lon=xi, lat=yi, depth=profile.depth_km))
+    xs, ys = conversion_math.latlon2xy_array(profile.lon1d, profile.lat1d, inputs.zerolon, inputs.zerolat)
+    strain_points = [Displacement_points(lon=xi, lat=yi, depth=profile.depth_km) for xi, yi in zip(xs.tolist(),
+                                                                                                   ys.tolist())]
 
     strain_tensors = compute_xy_strain(inputs, params, strain_points)
 
-    for i in range(len(strain_tensors)):
-        stress_tensor = conversion_math.get_stress_tensor(strain_tensors[i], params.lame1, params.mu)
-
-        # Then compute shear, normal, and coulomb stresses.
-        [normal, shear, coulomb] = conversion_math.get_coulomb_stresses_internal(stress_tensor, rec_strike_v,
-                                                                                 profile.rake, rec_dip_v,
-                                                                                 rec_plane_normal, inputs.FRIC,
-                                                                                 params.B)
-
-        receiver_normal.append(normal)
-        receiver_shear.append(shear)
-        receiver_coulomb.append(coulomb)
-
-    return receiver_normal, receiver_shear, receiver_coulomb
+    # Then compute shear, normal, and coulomb stresses on every point of the profile at once.
+    [normal, shear, coulomb] = conversion_math.get_coulomb_stresses_from_strain_batch(
+        strain_tensors, params.lame1, params.mu, rec_strike_v, profile.rake, rec_dip_v, rec_plane_normal,
+        inputs.FRIC, params.B)
+    return normal, shear, coulomb
 
 
 def compute_strains_stresses(params, inputs):
@@ -245,31 +233,25 @@ def compute_strains_stresses(params, inputs):
     """
 
     # The values we're actually going to output.
-    receiver_shear, receiver_normal, receiver_coulomb, target_points = [], [], [], []
+    receiver_shear, receiver_normal, receiver_coulomb = np.empty(0), np.empty(0), np.empty(0)
     if not inputs.receiver_object:
         return [receiver_normal, receiver_shear, receiver_coulomb]
     if not params.plot_stress:
         return [receiver_normal, receiver_shear, receiver_coulomb]
 
     print("Resolving stresses on receiver fault(s).")
-    for rec in inputs.receiver_object:
-        centercoords = rec.get_fault_center()  # in cartesian coordinates
-        strain_point = Displacement_points(lon=centercoords[0], lat=centercoords[1], depth=centercoords[2])
-        target_points.append(strain_point)
+    receivers = inputs.get_receiver_array()
+    center_x, center_y, center_z = receivers.get_fault_center()  # in cartesian coordinates
+    target_points = [Displacement_points(lon=x, lat=y, depth=z) for x, y, z in zip(center_x.tolist(),
+                                                                                   center_y.tolist(),
+                                                                                   center_z.tolist())]
 
     strain_tensors = compute_xy_strain(inputs, params, target_points)
 
-    for rec, strain_tensor in zip(inputs.receiver_object, strain_tensors):
-        stress_tensor = conversion_math.get_stress_tensor(strain_tensor, params.lame1, params.mu)
-
-        # Then compute shear, normal, and coulomb stresses.
-        [normal, shear, coulomb] = conversion_math.get_coulomb_stresses_internal(stress_tensor, rec.strike_unit_vector,
-                                                                                 rec.rake, rec.dip_unit_vector,
-                                                                                 rec.plane_normal, inputs.FRIC,
-                                                                                 params.B)
-        receiver_normal.append(normal)
-        receiver_shear.append(shear)
-        receiver_coulomb.append(coulomb)
+    # Then compute shear, normal, and coulomb stresses on all receivers at once.
+    [normal, shear, coulomb] = conversion_math.get_coulomb_stresses_from_strain_batch(
+        strain_tensors, params.lame1, params.mu, receivers.strike_unit_vector, receivers.rake,
+        receivers.dip_unit_vector, receivers.plane_normal, inputs.FRIC, params.B)
 
-    # return lists of normal, shear, coulomb values for each receiver.
-    return receiver_normal, receiver_shear, receiver_coulomb
+    # return arrays of normal, shear, coulomb values for each receiver.
+    return normal, shear, coulomb
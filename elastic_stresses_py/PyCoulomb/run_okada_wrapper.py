@@ -1,6 +1,5 @@
 import numpy as np
-from okada_wrapper import dc3dwrapper, dc3d0wrapper
-from Tectonic_Utils.geodesy import fault_vector_functions
+from okada_wrapper.DC3D import dc3d, dc3d0
 from .disp_points_object.disp_points_object import Displacement_points
 from . import conversion_math, utilities
 
@@ -13,10 +12,18 @@ def compute_ll_def(inputs, params, disp_points):
         return []
     model_disp_points = []
     print("Number of disp_points:", len(disp_points))
-    for point in disp_points:
-        [xi, yi] = fault_vector_functions.latlon2xy(point.lon, point.lat, inputs.zerolon, inputs.zerolat)
-        u_disp, v_disp, w_disp = compute_surface_disp_point(inputs.source_object, params.alpha, xi, yi,
-                                                            compute_depth=point.depth)
+    xs, ys = conversion_math.latlon2xy_array([point.lon for point in disp_points],
+                                             [point.lat for point in disp_points], inputs.zerolon, inputs.zerolat)
+    zs = [point.depth for point in disp_points]
+
+    # Loop over sources on the outside, computing all points for each source at once.
+    src_cache = [SourceCache(source) for source in inputs.source_object]
+    u_total = np.zeros((len(disp_points), 3))
+    for source, cache in zip(inputs.source_object, src_cache):
+        _, u = compute_strains_stresses_from_one_fault_batch(source, xs, ys, zs, params.alpha, src_cache=cache)
+        u_total += u
+
+    for point, (u_disp, v_disp, w_disp) in zip(disp_points, u_total.tolist()):
         model_point = Displacement_points(lon=point.lon, lat=point.lat,
                                           dE_obs=u_disp,
                                           dN_obs=v_disp,
@@ -26,7 +33,7 @@ def compute_ll_def(inputs, params, disp_points):
     return model_disp_points
 
 
-def compute_surface_disp_point(sources, alpha, x, y, compute_depth=0):
+def compute_surface_disp_point(sources, alpha, x, y, compute_depth=0, src_cache=None):
     """
     A major compute loop for each fault source object at one x/y point.
     x/y in the same coordinate system as the fault object. Computes displacement and strain tensor.
@@ -36,18 +43,18 @@ def compute_surface_disp_point(sources, alpha, x, y, compute_depth=0):
     :param x: float
     :param y: float
     :param compute_depth: depth of observation. Default depth is at surface of earth
+    :param src_cache: optional list of SourceCache, one for each source, built once by a caller looping over points
     :returns: three floats
     """
-    u_disp, v_disp, w_disp = 0, 0, 0
-
-    for source in sources:
-        desired_coords_grad_u, desired_coords_u = compute_strains_stresses_from_one_fault(source, x, y, compute_depth,
-                                                                                          alpha)
+    if src_cache is None:
+        src_cache = [SourceCache(source) for source in sources]
+    disp_total = np.zeros(3)  # east, north, vertical
+    for cache in src_cache:
+        _, desired_coords_u = _dc3d_at_point(cache, x, y, compute_depth, alpha)
         # Update the displacements from all sources
-        u_disp = u_disp + desired_coords_u[0][0]
-        v_disp = v_disp + desired_coords_u[1][0]
-        w_disp = w_disp + desired_coords_u[2][0]  # vertical
+        disp_total += desired_coords_u
 
+    u_disp, v_disp, w_disp = disp_total
     return u_disp, v_disp, w_disp
 
 
@@ -60,16 +67,21 @@ def compute_ll_strain(inputs, params, strain_points):
     print("Number of strain_points:", len(strain_points))
     cartesian_strain_points = utilities.convert_ll2xy_disp_points(strain_points, inputs.zerolon, inputs.zerolat)
 
-    strain_tensor_results = []
-    # For each coordinate requested.
-    for point in cartesian_strain_points:
-        strain_tensor = compute_strain_point(inputs.source_object, params.alpha, point.lon, point.lat, point.depth)
-        strain_tensor_results.append(strain_tensor)
+    xs = [point.lon for point in cartesian_strain_points]
+    ys = [point.lat for point in cartesian_strain_points]
+    zs = [point.depth for point in cartesian_strain_points]
+
+    # Loop over sources on the outside, computing all points for each source at once.
+    src_cache = [SourceCache(source) for source in inputs.source_object]
+    strain_tensors_total = np.zeros((len(cartesian_strain_points), 3, 3))
+    for source, cache in zip(inputs.source_object, src_cache):
+        grad_u, _ = compute_strains_stresses_from_one_fault_batch(source, xs, ys, zs, params.alpha, src_cache=cache)
+        strain_tensors_total += 0.5 * (grad_u + np.swapaxes(grad_u, 1, 2))
 
-    return strain_tensor_results
+    return strain_tensors_total
 
 
-def compute_strain_point(sources, alpha, x, y, compute_depth=0):
+def compute_strain_point(sources, alpha, x, y, compute_depth=0, src_cache=None):
     """
     A major compute loop for each fault source object at one x/y point.
     x/y in the same coordinate system as the fault object. Computes strain tensor.
@@ -79,46 +91,152 @@ def compute_strain_point(sources, alpha, x, y, compute_depth=0):
     :param x: float
     :param y: float
     :param compute_depth: depth of observation. Default depth is at surface of earth
+    :param src_cache: optional list of SourceCache, one for each source, built once by a caller looping over points
     :returns: 3x3 matrix
     """
+    if src_cache is None:
+        src_cache = [SourceCache(source) for source in sources]
     strain_tensor_total = np.zeros((3, 3))
-    for source in sources:
-        desired_coords_grad_u, desired_coords_u = compute_strains_stresses_from_one_fault(source, x, y, compute_depth,
-                                                                                          alpha)
+    for cache in src_cache:
+        desired_coords_grad_u, _ = _dc3d_at_point(cache, x, y, compute_depth, alpha)
         # Strain tensor math
-        strain_tensor = conversion_math.get_strain_tensor(desired_coords_grad_u)
-        strain_tensor_total = np.add(strain_tensor, strain_tensor_total)
+        strain_tensor_total += conversion_math.get_strain_tensor(desired_coords_grad_u)
     return strain_tensor_total
 
 
-def compute_strains_stresses_from_one_fault(source, x, y, z, alpha):
+class SourceCache:
+    """
+    The parts of a source's dc3d call that don't depend on the observation point.
+    Built once per source by the caller that loops over points, and passed to the compute functions as src_cache.
+    """
+    __slots__ = ['xstart', 'ystart', 'R', 'R2', 'depth', 'dip', 'is_point_source', 'al', 'aw', 'disl', 'potency',
+                 'u_scale', 'grad_u_scale', 'scales']
+
+    def __init__(self, source):
+        self.xstart, self.ystart = source.xstart, source.ystart
+        self.R, self.R2 = source.R, source.R2
+        self.depth, self.dip = source.top, source.dipangle
+        self.is_point_source = bool(source.potency)
+        if self.is_point_source:
+            self.potency = [source.potency[0], source.potency[1], source.potency[2], source.potency[3]]
+            self.grad_u_scale = 1e-9  # DC3D0 Unit correction: potency from N-m results in strain in nanostrain
+            self.u_scale = 1e-6  # Unit correction: potency from N-m results in displacements in microns.
+        else:
+            self.al, self.aw = [0, source.L], [-source.W, 0]
+            # The dc3d coordinate system has left-lateral positive.
+            self.disl = [source.rtlat * -1, source.reverse, source.tensile]
+            self.grad_u_scale, self.u_scale = 1e-3, 1  # DC3D Unit correction.
+        self.scales = np.array([self.u_scale] * 3 + [self.grad_u_scale] * 9, dtype=float)  # for one point's outputs
+
+
+def compute_strains_stresses_from_one_fault(source, x, y, z, alpha, src_cache=None):
     """
     The main math of DC3D
     Operates on a source object (e.g., fault),
     and an xyz position in the same cartesian reference frame.
+    Returns the displacement gradient (3x3) and the displacement vector (3).
+    src_cache is an optional SourceCache for the source, re-used across many points.
+    """
+    if src_cache is None:
+        src_cache = SourceCache(source)
+    return _dc3d_at_point(src_cache, x, y, z, alpha)
+
+
+def _dc3d_at_point(src_cache, x, y, z, alpha):
     """
-    R = source.R
-    R2 = source.R2
-    strike_slip = source.rtlat * -1  # The dc3d coordinate system has left-lateral positive.
+    Translate and rotate one point into the source's frame, call dc3d, and rotate the results back.
+
+    :param src_cache: a SourceCache
+    :returns: displacement gradient with shape (3, 3), displacement with shape (3)
+    """
+    R2 = src_cache.R2
 
     # Compute the position relative to the translated, rotated fault.
-    translated_pos = np.array(
-        [[x - source.xstart], [y - source.ystart], [-z]])
-    xyz = R.dot(translated_pos)
-    if source.potency:
-        success, u, grad_u = dc3d0wrapper(alpha, [xyz[0][0], xyz[1][0], xyz[2][0]], source.top, source.dipangle,
-                                          [source.potency[0], source.potency[1], source.potency[2],
-                                           source.potency[3]])
-        grad_u = grad_u * 1e-9  # DC3D0 Unit correction: potency from N-m results in strain in nanostrain
-        u = u * 1e-6  # Unit correction: potency from N-m results in displacements in microns.
+    xr, yr, zr = src_cache.R.dot([x - src_cache.xstart, y - src_cache.ystart, -z])
+    if src_cache.is_point_source:
+        pot1, pot2, pot3, pot4 = src_cache.potency
+        results = dc3d0(alpha, xr, yr, zr, src_cache.depth, src_cache.dip, pot1, pot2, pot3, pot4)
     else:
-        success, u, grad_u = dc3dwrapper(alpha, [xyz[0][0], xyz[1][0], xyz[2][0]], source.top, source.dipangle,
-                                         [0, source.L], [-source.W, 0],
-                                         [strike_slip, source.reverse, source.tensile])
-        grad_u = grad_u * 1e-3  # DC3D Unit correction.
-    # Solve for displacement gradients at certain xyz position
-
-    # Rotate grad_u back into the unprimed coordinates.
-    desired_coords_grad_u = np.dot(R2, np.dot(grad_u, R2.T))
-    desired_coords_u = R2.dot(np.array([[u[0]], [u[1]], [u[2]]]))
+        results = dc3d(alpha, xr, yr, zr, src_cache.depth, src_cache.dip, src_cache.al[0], src_cache.al[1],
+                       src_cache.aw[0], src_cache.aw[1], src_cache.disl[0], src_cache.disl[1], src_cache.disl[2])
+    results = np.array(results[0:12])  # u (3), grad_u (9); the success flag is dropped
+    results *= src_cache.scales
+    u, grad_u = results[0:3], results[3:12].reshape(3, 3)
+
+    # Rotate grad_u and u back into the unprimed coordinates.
+    desired_coords_grad_u = R2 @ grad_u @ R2.T
+    desired_coords_u = R2 @ u
     return desired_coords_grad_u, desired_coords_u
+
+
+def compute_strains_stresses_from_one_fault_batch(source, x, y, z, alpha, src_cache=None):
+    """
+    The main math of DC3D, for one source and many points.
+    Same as compute_strains_stresses_from_one_fault, but the translation and rotations into and out of
+    the fault's coordinate system are done once for all points.
+
+    :param source: a fault object
+    :param x: 1d array of K x-positions, in the same cartesian reference frame as the source
+    :param y: 1d array of K y-positions
+    :param z: 1d array of K depths, positive down
+    :param alpha: float
+    :param src_cache: optional SourceCache for the source
+    :returns: displacement gradients with shape (K, 3, 3), displacements with shape (K, 3)
+    """
+    x, y, z = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(z, dtype=float))
+    if src_cache is None:
+        src_cache = SourceCache(source)
+    R = src_cache.R
+    R2 = src_cache.R2
+
+    # Compute the positions relative to the translated, rotated fault.
+    translated_pos = np.vstack([x - src_cache.xstart, y - src_cache.ystart, -z])  # shape (3, K)
+    xyz = R.dot(translated_pos).T.tolist()
+
+    if src_cache.is_point_source:
+        u, grad_u = _dc3d0_potency_batch(src_cache, xyz, alpha)
+    else:
+        u, grad_u = _dc3d_slip_batch(src_cache, xyz, alpha)
+
+    # Rotate grad_u and u back into the unprimed coordinates.
+    desired_coords_grad_u = np.matmul(np.matmul(R2, grad_u), R2.T)
+    desired_coords_u = u.dot(R2.T)
+    return desired_coords_grad_u, desired_coords_u
+
+
+def _dc3d_slip_batch(src_cache, xyz, alpha):
+    """
+    Call the compiled DC3D routine for a finite fault once per point, in the source's frame.
+    Calls the f2py function directly rather than through dc3dwrapper, which allocates and fills
+    two small arrays on every call, and unpacks all the outputs with a single array conversion.
+
+    :param src_cache: a SourceCache for a finite fault
+    :param xyz: list of K [x, y, z] positions, already rotated into the source's frame
+    :param alpha: float
+    :returns: displacements with shape (K, 3), displacement gradients with shape (K, 3, 3), with unit corrections
+    """
+    depth, dip = src_cache.depth, src_cache.dip
+    al1, al2 = src_cache.al
+    aw1, aw2 = src_cache.aw
+    disl1, disl2, disl3 = src_cache.disl
+    results = [dc3d(alpha, x, y, z, depth, dip, al1, al2, aw1, aw2, disl1, disl2, disl3) for x, y, z in xyz]
+    return _unpack_dc3d_results(results, src_cache)
+
+
+def _dc3d0_potency_batch(src_cache, xyz, alpha):
+    """
+    Call the compiled DC3D0 routine for a point source once per point, in the source's frame.
+    Same as _dc3d_slip_batch, for sources given by potency.
+    """
+    depth, dip = src_cache.depth, src_cache.dip
+    pot1, pot2, pot3, pot4 = src_cache.potency
+    results = [dc3d0(alpha, x, y, z, depth, dip, pot1, pot2, pot3, pot4) for x, y, z in xyz]
+    return _unpack_dc3d_results(results, src_cache)
+
+
+def _unpack_dc3d_results(results, src_cache):
+    """Convert a list of K raw dc3d output tuples into unit-corrected arrays of u (K, 3) and grad_u (K, 3, 3)."""
+    results = np.array(results, dtype=float).reshape(len(results), 13)  # u (3), grad_u (9), success flag
+    u = results[:, 0:3] * src_cache.u_scale
+    grad_u = results[:, 3:12].reshape(len(results), 3, 3) * src_cache.grad_u_scale
+    return u, grad_u
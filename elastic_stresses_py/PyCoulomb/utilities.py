@@ -5,8 +5,8 @@ from Tectonic_Utils.seismo import moment_calculations
 from . import fault_slip_object as fso
 from . import pyc_fault_object as pycfaults
 from . import coulomb_collections as cc
+from . import conversion_math
 from .disp_points_object.disp_points_object import Displacement_points
-from Tectonic_Utils.geodesy import fault_vector_functions
 
 
 def define_colorbar_series(plotting_array, vmin=None, vmax=None, tol=0.0005, v_labeling_interval=None):
@@ -79,7 +79,7 @@ def produce_vmin_vmax_symmetric(plotting_array, vmin, vmax):
     :param vmin: float
     :param vmax: float
     """
-    if not plotting_array:
+    if plotting_array is None or len(plotting_array) == 0:
         return -1, 1
     auto_vmin = np.min(plotting_array)  # one number
     auto_vmax = np.max(plotting_array)  # one number
@@ -201,8 +201,9 @@ def convert_ll2xy_disp_points(disp_points, zerolon, zerolat):
     :return: list of disp_points relative to center of coordinate system. All lon/lat/depths are in km.
     """
     cartesian_disp_points = []
-    for point in disp_points:
-        [xi, yi] = fault_vector_functions.latlon2xy(point.lon, point.lat, zerolon, zerolat)
+    xs, ys = conversion_math.latlon2xy_array([point.lon for point in disp_points],
+                                             [point.lat for point in disp_points], zerolon, zerolat)
+    for point, xi, yi in zip(disp_points, xs.tolist(), ys.tolist()):
         model_point = Displacement_points(lon=xi, lat=yi, depth=point.depth, dE_obs=point.dE_obs, dN_obs=point.dN_obs,
                                           dU_obs=point.dU_obs, name=point.name)
         cartesian_disp_points.append(model_point)
@@ -1,7 +1,9 @@
 # Test the conversion between four different formats for slip distributions and fault geometry.
 
 import unittest
+import numpy as np
 import elastic_stresses_py.PyCoulomb.fault_slip_object as fso
+from elastic_stresses_py.PyCoulomb import utilities
 
 
 example_fault = fso.fault_slip_object.FaultSlipObject(strike=5, dip=75, length=40, width=20, lon=-123.00, lat=40.00,
@@ -29,6 +31,39 @@ class Tests(unittest.TestCase):
             self.assertAlmostEqual(a[1], b[1])   # print(a[1], b[1])
         return
 
+    def test_four_corners_array(self):
+        faults = [example_fault, example_fault.change_fault_slip(new_slip=2, new_rake=90)]
+        lons, lats = fso.fault_slip_object.get_four_corners_lon_lat_array(faults)
+        for i, fault in enumerate(faults):
+            expected_lons, expected_lats = fault.get_four_corners_lon_lat()
+            np.testing.assert_allclose(lons[i], expected_lons)
+            np.testing.assert_allclose(lats[i], expected_lats)
+        return
+
+    def test_gmt_fault_file_color_array(self):
+        flush_file = "test/example_gmt_faults.txt"
+        pycoulomb_faults = fso.fault_slip_object.fault_object_to_coulomb_fault([example_fault, example_fault])
+        utilities.write_fault_edges_to_gmt_file(pycoulomb_faults, flush_file, color_array=np.array([2.5, -1.0]))
+        with open(flush_file, 'r') as ifile:
+            headers = [line.split()[1] for line in ifile if line.startswith('>')]
+        self.assertEqual(headers, ['-Z2.5', '-Z-1.0'])
+        return
+
+    def test_string_segment_labels(self):
+        flush_file = "test/example_gmt_segments.txt"
+        labeled_fault = fso.fault_slip_object.FaultSlipObject(strike=5, dip=75, length=40, width=20, lon=-123.00,
+                                                              lat=40.00, depth=3, rake=10, slip=1, tensile=0,
+                                                              segment='Seg A')
+        fault_array = fso.fault_slip_object.fault_object_list_to_fault_array([labeled_fault, example_fault])
+        self.assertEqual(list(fault_array.segment), ['Seg A', 0])
+        self.assertEqual(list(fault_array[fault_array.segment == 'Seg A'].segment), ['Seg A'])
+        bbox = fso.fault_slip_object.get_four_corners_lon_lat_multiple([labeled_fault])
+        np.testing.assert_allclose(bbox, fso.fault_slip_object.get_four_corners_lon_lat_multiple([example_fault]))
+        fso.file_io.outputs.write_gmt_fault_file([labeled_fault], flush_file)
+        with open(flush_file, 'r') as ifile:
+            self.assertEqual(sum(line.startswith('>') for line in ifile), 1)
+        return
+
     def test_io_slippy(self):
         flush_file = "test/example_slippy.txt"
         fso.file_io.io_slippy.write_slippy_distribution([example_fault, example_fault], flush_file)
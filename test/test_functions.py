@@ -1,7 +1,10 @@
 # Testing code
 
 import unittest
+import numpy as np
 import elastic_stresses_py.PyCoulomb as PyCoulomb
+from elastic_stresses_py.PyCoulomb import conversion_math
+from Tectonic_Utils.geodesy import fault_vector_functions
 
 class Tests(unittest.TestCase):
 
@@ -25,6 +28,91 @@ class Tests(unittest.TestCase):
         self.assertAlmostEqual(out_object.receiver_coulomb[0], -230.576, places=3)
         return
 
+    def test_stress_tensor_batch(self):
+        """ The batched stress tensor should match the single-tensor calculation. """
+        strain_tensors = np.random.default_rng(0).normal(size=(5, 3, 3)) * 1e-6
+        stress_tensors = conversion_math.get_stress_tensor_batch(strain_tensors, 30e9, 32e9)
+        for eij, stress_tensor in zip(strain_tensors, stress_tensors):
+            np.testing.assert_allclose(conversion_math.get_stress_tensor(eij, 30e9, 32e9), stress_tensor)
+        return
+
+    def test_coulomb_stresses_batch(self):
+        """ Resolving stresses on many receivers at once should match the one-receiver calculation. """
+        rng = np.random.default_rng(1)
+        tau = rng.normal(size=(4, 3, 3)) * 1e5
+        strikes, dips, rakes = [10, 95, 200, 340], [30, 45, 60, 89], [0, 90, -45, 170]
+        strike_vecs = np.array([fault_vector_functions.get_strike_vector(s) for s in strikes])
+        dip_vecs = np.array([fault_vector_functions.get_dip_vector(s, d) for s, d in zip(strikes, dips)])
+        normals = np.array([fault_vector_functions.get_plane_normal(s, d) for s, d in zip(strikes, dips)])
+        normal, shear, coulomb = conversion_math.get_coulomb_stresses_batch(tau, strike_vecs, np.array(rakes),
+                                                                             dip_vecs, normals, 0.4, 0.5)
+        for i in range(len(tau)):
+            expected = conversion_math.get_coulomb_stresses_internal(tau[i], strike_vecs[i], rakes[i], dip_vecs[i],
+                                                                     normals[i], 0.4, 0.5)
+            np.testing.assert_allclose([normal[i], shear[i], coulomb[i]], expected)
+        strain_tensors = conversion_math.get_strain_tensor(rng.normal(size=(3, 3))) * 1e-6 + np.zeros((4, 3, 3))
+        stress_tensors = conversion_math.get_stress_tensor_batch(strain_tensors, 30e9, 32e9)
+        expected = conversion_math.get_coulomb_stresses_batch(stress_tensors, strike_vecs, np.array(rakes), dip_vecs,
+                                                              normals, 0.4, 0.5)
+        fused = conversion_math.get_coulomb_stresses_from_strain_batch(strain_tensors, 30e9, 32e9, strike_vecs,
+                                                                       np.array(rakes), dip_vecs, normals, 0.4, 0.5)
+        np.testing.assert_allclose(fused, expected)
+        return
+
+    def test_fault_array_center(self):
+        """ Vectorized patch centers should match the centers of the individual fault objects. """
+        faults = [PyCoulomb.coulomb_collections.Faults_object(xstart=i, xfinish=i+2, ystart=-i, yfinish=1-i,
+                                                              zerolon=-120, zerolat=36, strike=20*i, dipangle=30+10*i,
+                                                              rake=0, top=i, bottom=2*i+1) for i in range(5)]
+        fault_array = PyCoulomb.pyc_fault_object.faults_list_to_arrays(faults)
+        center_x, center_y, center_z = fault_array.get_fault_center()
+        for i, fault in enumerate(faults):
+            np.testing.assert_allclose([center_x[i], center_y[i], center_z[i]], fault.get_fault_center())
+            np.testing.assert_allclose(fault_array.plane_normal[i], fault.plane_normal, atol=1e-15)
+            np.testing.assert_allclose(fault_array.dip_unit_vector[i], fault.dip_unit_vector, atol=1e-15)
+        shallow_array = fault_array[fault_array.top < 2]
+        self.assertEqual(len(shallow_array), 2)
+        np.testing.assert_allclose(shallow_array.get_fault_center()[2], center_z[0:2])
+        return
+
+    def test_source_tri_arrays(self):
+        """ Splitting the cached source array into triangles should match converting each rectangle separately. """
+        faults = [PyCoulomb.coulomb_collections.Faults_object(xstart=i, xfinish=i+2, ystart=-i, yfinish=1-i,
+                                                              zerolon=-120, zerolat=36, strike=20*i, dipangle=30+10*i,
+                                                              rake=0, top=i, bottom=2*i+1, rtlat=i, reverse=1,
+                                                              tensile=0.1*i) for i in range(3)]
+        inputs = PyCoulomb.inputs_object.input_obj.configure_default_displacement_input(faults, -120, 36,
+                                                                                       [-121, -119, 35, 37])
+        src_tris, slip_array = PyCoulomb.fault_slip_triangle.triangle_okada.get_source_tri_arrays(inputs)
+        tri_faults = PyCoulomb.fault_slip_triangle.triangle_okada.convert_rect_sources_into_tris(faults)
+        for i, tri in enumerate(tri_faults):
+            np.testing.assert_allclose(src_tris[i], np.array([tri.vertex1, tri.vertex2, tri.vertex3]) * [1, 1, -1])
+            np.testing.assert_allclose(slip_array[i], [-tri.rtlat_slip, tri.dip_slip, tri.tensile])
+        return
+
+    def test_input_object_cached_arrays(self):
+        """ Reassigning the sources or receivers of an Input_object should replace their cached FaultArrays. """
+        faults = [PyCoulomb.coulomb_collections.Faults_object(xstart=i, xfinish=i+2, ystart=-i, yfinish=1-i,
+                                                              zerolon=-120, zerolat=36, strike=20*i, dipangle=30+10*i,
+                                                              rake=0, top=i, bottom=2*i+1) for i in range(3)]
+        inputs = PyCoulomb.inputs_object.input_obj.configure_default_displacement_input(faults, -120, 36,
+                                                                                       [-121, -119, 35, 37])
+        self.assertEqual(len(inputs.get_source_array()), 3)
+        inputs.source_object = faults[0:2]
+        self.assertEqual(len(inputs.get_source_array()), 2)
+        inputs.receiver_object = faults[0:1]
+        self.assertEqual(len(inputs.get_receiver_array()), 1)
+        return
+
+    def test_latlon2xy_array(self):
+        """ The array conversion to cartesian should match the point-by-point conversion. """
+        lons, lats = [-121.5, -120.0, -119.2, -120.0], [35.1, 36.0, 37.3, 36.8]
+        xs, ys = conversion_math.latlon2xy_array(lons, lats, -120.0, 36.0)
+        for i in range(len(lons)):
+            x, y = fault_vector_functions.latlon2xy_single(lons[i], lats[i], -120.0, 36.0)
+            np.testing.assert_allclose([xs[i], ys[i]], [x, y], atol=1e-9)
+        return
+
 
 if __name__ == "__main__":
     unittest.main()